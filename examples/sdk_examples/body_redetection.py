@@ -4,7 +4,6 @@ Module realize simple examples following features:
     * redetect several humans
 """
 import asyncio
-import pprint
 
 from resources import EXAMPLE_O, EXAMPLE_SEVERAL_FACES
 
@@ -23,13 +22,13 @@ def detectBodies():
 
     imageWithOneBody = VLImage.load(filename=EXAMPLE_O)
     detection = detector.detectOne(imageWithOneBody, detectLandmarks=False)
-    pprint.pprint(detector.redetectOne(image=imageWithOneBody, bBox=detection))
-    pprint.pprint(detector.redetectOne(image=imageWithOneBody, bBox=detection.boundingBox.rect))
+    print(detector.redetectOne(image=imageWithOneBody, bBox=detection))
+    print(detector.redetectOne(image=imageWithOneBody, bBox=detection.boundingBox.rect))
 
     imageWithSeveralBodies = VLImage.load(filename=EXAMPLE_SEVERAL_FACES)
     severalBodies = detector.detect([imageWithSeveralBodies], detectLandmarks=False)
 
-    pprint.pprint(
+    print(
         detector.redetect(
             images=[
                 ImageForRedetection(imageWithSeveralBodies, [human.boundingBox.rect for human in severalBodies[0]]),
@@ -47,10 +46,13 @@ async def asyncRedetectBodies():
     faceEngine = VLFaceEngine()
     detector = faceEngine.createBodyDetector()
 
-    imageWithOneBody = VLImage.load(filename=EXAMPLE_O)
+    # decode both images in worker threads instead of blocking the event loop
+    imageWithOneBody, imageWithSeveralBodies = await asyncio.gather(
+        asyncio.to_thread(VLImage.load, filename=EXAMPLE_O),
+        asyncio.to_thread(VLImage.load, filename=EXAMPLE_SEVERAL_FACES),
+    )
     detection = detector.detectOne(imageWithOneBody, detectLandmarks=False)
     detection = await detector.redetectOne(image=imageWithOneBody, bBox=detection, asyncEstimate=True)
-    imageWithSeveralBodies = VLImage.load(filename=EXAMPLE_SEVERAL_FACES)
     severalBodies = detector.detect([imageWithSeveralBodies], detectLandmarks=False)
 
     task1 = detector.redetect(
@@ -65,8 +67,8 @@ async def asyncRedetectBodies():
         ],
         asyncEstimate=True,
     )
-    for task in (task1, task2):
-        pprint.pprint(task.get())
+    for redetections in await asyncio.gather(task1, task2):
+        print(redetections)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from resources import EXAMPLE_1, EXAMPLE_O
 from lunavl.sdk.faceengine.engine import VLFaceEngine
 from lunavl.sdk.faceengine.setting_provider import DetectorType
 from lunavl.sdk.image_utils.image import VLImage
+from lunavl.sdk.pipeline import detectAndEstimate
 
 
 def estimateMedicalMask():
@@ -60,6 +61,10 @@ async def asyncEstimateMedicalMask():
     for task in (task1, task2):
         pprint.pprint(task.get())
 
+    # staged pipeline: detect faces and estimate masks for several images at once
+    masksPerImage = await detectAndEstimate([image, VLImage.load(filename=EXAMPLE_1)], detector, medicalMaskEstimator)
+    pprint.pprint([[mask.asDict() for mask in masks] for masks in masksPerImage])
+
 
 if __name__ == "__main__":
     estimateMedicalMask()
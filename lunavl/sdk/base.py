@@ -198,6 +198,8 @@ class BoundingBox(BaseEstimation):
                          and not the source image quality. It may be used topick the most "*confident*" face of many.
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, boundingBox: Detection):
         """
@@ -111,16 +111,18 @@ def getArgsForCoreDetectorForImages(
                second - detect area for corresponding images
     """
 
-    coreImages, detectAreas = [], []
+    imagesCount = len(images)
+    coreImages: List[CoreImage] = [None] * imagesCount  # type: ignore
+    detectAreas: List[CoreRectI] = [None] * imagesCount  # type: ignore
 
-    for image in images:
+    for index, image in enumerate(images):
         if isinstance(image, VLImage):
-            img = image
-            detectAreas.append(image.coreImage.getRect())
+            coreImage = image.coreImage
+            detectAreas[index] = image.coreRect
         else:
-            img = image.image
-            detectAreas.append(image.detectArea.coreRectI)
-        coreImages.append(img.coreImage)
+            coreImage = image.image.coreImage
+            detectAreas[index] = image.detectArea.coreRectI
+        coreImages[index] = coreImage
 
     return coreImages, detectAreas
 
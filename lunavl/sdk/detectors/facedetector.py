@@ -3,7 +3,9 @@ Module contains function for detection faces on images.
 """
 from enum import Enum
 from functools import partial
-from typing import Any, Dict, List, Literal, Optional, Union, overload
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union, overload
+
+import numpy as np
 
 from FaceEngine import (  # pylint: disable=E0611,E0401
     DT_LANDMARKS5,
@@ -38,6 +40,15 @@ from ..image_utils.image import VLImage
 from ..launch_options import LaunchOptions
 
 
+#: core detection type map precomputed for all (detect5Landmarks, detect68Landmarks) combinations
+_DETECTION_TYPE_MAP: Dict[Tuple[bool, bool], DetectionType] = {
+    (False, False): DetectionType(0),
+    (True, False): DetectionType(0 | DT_LANDMARKS5),
+    (False, True): DetectionType(0 | DT_LANDMARKS68),
+    (True, True): DetectionType(0 | DT_LANDMARKS5 | DT_LANDMARKS68),
+}
+
+
 class FaceLandmarks(Enum):
     """Face landmarks types"""
 
@@ -50,6 +61,8 @@ class Landmarks5(Landmarks):
     Landmarks5
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, coreLandmark5: CoreLandmarks5):
         """
@@ -66,6 +79,8 @@ class Landmarks68(Landmarks):
     Landmarks68
     """
 
+    __slots__ = ()
+
     #  pylint: disable=W0235
     def __init__(self, coreLandmark68: CoreLandmarks68):
         """
@@ -77,14 +92,18 @@ class Landmarks68(Landmarks):
         super().__init__(coreLandmark68)
 
 
+#: sentinel for not materialized lazy attributes of `FaceDetection`
+_UNSET: Any = object()
+
+
 class FaceDetection(BaseDetection):
     """
     Attributes:
-        landmarks5 (Optional[Landmarks5]): optional landmarks5
-        landmarks68 (Optional[Landmarks68]): optional landmarks5
+        _landmarks5 (Union[Landmarks5, None, Any]): lazy loaded attribute: landmarks5
+        _landmarks68 (Union[Landmarks68, None, Any]): lazy loaded attribute: landmarks68
     """
 
-    __slots__ = ("landmarks5", "landmarks68")
+    __slots__ = ("_landmarks5", "_landmarks68")
 
     def __init__(self, coreDetection: Face, image: VLImage):
         """
@@ -95,15 +114,34 @@ class FaceDetection(BaseDetection):
         """
         super().__init__(coreDetection, image)
 
-        if coreDetection.landmarks5_opt.isValid():
-            self.landmarks5: Optional[Landmarks5] = Landmarks5(coreDetection.landmarks5_opt.value())
-        else:
-            self.landmarks5 = None
+        self._landmarks5: Any = _UNSET
+        self._landmarks68: Any = _UNSET
 
-        if coreDetection.landmarks68_opt.isValid():
-            self.landmarks68: Optional[Landmarks68] = Landmarks68(coreDetection.landmarks68_opt.value())
-        else:
-            self.landmarks68 = None
+    @property
+    def landmarks5(self) -> Optional[Landmarks5]:
+        """
+        Lazy landmarks5 loader.
+
+        Returns:
+            landmarks5 if they were detected otherwise None
+        """
+        if self._landmarks5 is _UNSET:
+            coreLandmarks5 = self._coreEstimation.landmarks5_opt
+            self._landmarks5 = Landmarks5(coreLandmarks5.value()) if coreLandmarks5.isValid() else None
+        return self._landmarks5
+
+    @property
+    def landmarks68(self) -> Optional[Landmarks68]:
+        """
+        Lazy landmarks68 loader.
+
+        Returns:
+            landmarks68 if they were detected otherwise None
+        """
+        if self._landmarks68 is _UNSET:
+            coreLandmarks68 = self._coreEstimation.landmarks68_opt
+            self._landmarks68 = Landmarks68(coreLandmarks68.value()) if coreLandmarks68.isValid() else None
+        return self._landmarks68
 
     def asDict(self) -> Dict[str, Any]:
         """
@@ -151,7 +189,6 @@ def _collectDetectionsResult(
     """
     res = []
     for imageIdx in range(fsdkDetectRes.getSize()):
-        imagesDetections = []
         detections = fsdkDetectRes.getDetections(imageIdx)
         landmarks5Array = fsdkDetectRes.getLandmarks5(imageIdx)
         landmarks68Array = fsdkDetectRes.getLandmarks68(imageIdx)
@@ -166,7 +203,6 @@ def _collectDetectionsResult(
                 face.landmarks5_opt.set(landmarks5Array[detectionIdx])
             if landmarks68Array:
                 face.landmarks68_opt.set(landmarks68Array[detectionIdx])
-            imagesDetections.append(face)
             if not face.isValid():
                 if not isRedectResult:
                     raise RuntimeError("Invalid detection")
@@ -324,14 +360,7 @@ class FaceDetector:
         Returns:
             detection type
         """
-        toDetect = 0
-
-        if detect5Landmarks:
-            toDetect = toDetect | DT_LANDMARKS5
-        if detect68Landmarks:
-            toDetect = toDetect | DT_LANDMARKS68
-
-        return DetectionType(toDetect)
+        return _DETECTION_TYPE_MAP[(detect5Landmarks, detect68Landmarks)]
 
     @overload  # type: ignore
     def detectOne(
@@ -379,7 +408,7 @@ class FaceDetector:
         """
 
         if detectArea is None:
-            _detectArea = image.coreImage.getRect()
+            _detectArea = image.coreRect
         else:
             _detectArea = detectArea.coreRectI
         validateBatchDetectInput(self._detector, image.coreImage, _detectArea)
@@ -448,6 +477,45 @@ class FaceDetector:
         error, fsdkDetectRes = self._detector.detect(coreImages, detectAreas, limit, detectionType)
         return postProcessing(error, fsdkDetectRes, images=images)
 
+    def detectArrays(
+        self,
+        images: List[Union[VLImage, ImageForDetection]],
+        limit: int = 5,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Batch detect faces on images and return detections as numpy arrays.
+
+        In contrast to `detect` the result is not wrapped into `FaceDetection` objects: for every image a pair
+        of contiguous arrays `(boxes, scores)` is returned, where `boxes` is a (N, 4) float32 array of bounding
+        boxes in (x, y, width, height) format and `scores` is a (N,) float32 array of detection scores. This
+        structure-of-arrays layout is intended for vectorized post-processing (thresholding, nms and so on).
+
+        Args:
+            images: input images list. Format must be R8G8B8
+            limit: max number of detections per input image
+
+        Returns:
+            list of (boxes, scores) pairs, order is corresponding to order of input images
+        Raises:
+            LunaSDKException: if an error occurs
+        """
+        coreImages, detectAreas = getArgsForCoreDetectorForImages(images)
+        validateBatchDetectInput(self._detector, coreImages, detectAreas)
+        error, fsdkDetectRes = self._detector.detect(coreImages, detectAreas, limit, self._getDetectionType(False))
+        assertError(error)
+        res = []
+        for imageIdx in range(fsdkDetectRes.getSize()):
+            detections = fsdkDetectRes.getDetections(imageIdx)
+            detectionCount = len(detections)
+            boxes = np.empty((detectionCount, 4), dtype=np.float32)
+            scores = np.empty(detectionCount, dtype=np.float32)
+            for detectionIdx, detection in enumerate(detections):
+                rect = detection.getRect()
+                boxes[detectionIdx] = (rect.x, rect.y, rect.width, rect.height)
+                scores[detectionIdx] = detection.getScore()
+            res.append((boxes, scores))
+        return res
+
     @overload
     def redetectOne(
         self,
@@ -48,19 +48,21 @@ class FaceOcclusionState(Enum):
         Returns:
             corresponding occlusion prediction
         """
-        if coreFaceOcclusion == DetailedMaskType.CorrectMask:
-            return FaceOcclusionState.Correct
-        if coreFaceOcclusion == DetailedMaskType.MouthCoveredWithMask:
-            return FaceOcclusionState.Mouth
-        if coreFaceOcclusion == DetailedMaskType.ClearFace:
-            return FaceOcclusionState.Clear
-        if coreFaceOcclusion == DetailedMaskType.ClearFaceWithMaskUnderChin:
-            return FaceOcclusionState.Chin
-        if coreFaceOcclusion == DetailedMaskType.PartlyCoveredFace:
-            return FaceOcclusionState.Partially
-        if coreFaceOcclusion == DetailedMaskType.FullMask:
-            return FaceOcclusionState.Full
-        raise RuntimeError(f"bad core mask state {coreFaceOcclusion}")
+        state = _CORE_TO_FACE_OCCLUSION_STATE.get(coreFaceOcclusion)
+        if state is None:
+            raise RuntimeError(f"bad core mask state {coreFaceOcclusion}")
+        return state
+
+
+#: core detailed mask type to face occlusion state map, built once at import
+_CORE_TO_FACE_OCCLUSION_STATE = {
+    DetailedMaskType.CorrectMask: FaceOcclusionState.Correct,
+    DetailedMaskType.MouthCoveredWithMask: FaceOcclusionState.Mouth,
+    DetailedMaskType.ClearFace: FaceOcclusionState.Clear,
+    DetailedMaskType.ClearFaceWithMaskUnderChin: FaceOcclusionState.Chin,
+    DetailedMaskType.PartlyCoveredFace: FaceOcclusionState.Partially,
+    DetailedMaskType.FullMask: FaceOcclusionState.Full,
+}
 
 
 class _FaceOcclusion(BaseEstimation):
@@ -80,6 +82,8 @@ class _FaceOcclusion(BaseEstimation):
         predominantOcclusion (FaceOcclusionState): predominant occlusion
     """
 
+    __slots__ = ("predominantOcclusion",)
+
     #  pylint: disable=W0235
     def __init__(self, scores: list[float], predominantOcclusion: DetailedMaskType):
         """
@@ -122,15 +126,16 @@ class _FaceOcclusion(BaseEstimation):
 
     def asDict(self) -> dict:
         """Convert estimation to dict"""
+        scores = self._coreEstimation
         return {
             "predominant_occlusion": self.predominantOcclusion.value,
             "estimations": {
-                "chin": self.chin,
-                "mouth": self.mouth,
-                "clear": self.clear,
-                "correct": self.correct,
-                "partially": self.partially,
-                "full": self.full,
+                "chin": scores[DetailedMaskType.ClearFaceWithMaskUnderChin],
+                "mouth": scores[DetailedMaskType.MouthCoveredWithMask],
+                "clear": scores[DetailedMaskType.ClearFace],
+                "correct": scores[DetailedMaskType.CorrectMask],
+                "partially": scores[DetailedMaskType.PartlyCoveredFace],
+                "full": scores[DetailedMaskType.FullMask],
             },
         }
 
@@ -158,13 +163,25 @@ class MaskState(Enum):
         Returns:
             corresponding mask prediction
         """
-        if coreMask == CoreMask.NoMask:
-            return MaskState.Missing
-        if coreMask == CoreMask.Mask:
-            return MaskState.MedicalMask
-        if coreMask == CoreMask.OccludedFace:
-            return MaskState.Occluded
-        raise RuntimeError(f"bad core mask state {coreMask}")
+        state = _CORE_TO_MASK_STATE.get(coreMask)
+        if state is None:
+            raise RuntimeError(f"bad core mask state {coreMask}")
+        return state
+
+
+#: core mask to mask state map, built once at import
+_CORE_TO_MASK_STATE = {
+    CoreMask.NoMask: MaskState.Missing,
+    CoreMask.Mask: MaskState.MedicalMask,
+    CoreMask.OccludedFace: MaskState.Occluded,
+}
+
+#: mask state to predominant mask name map for serialization
+_PREDOMINANT_MASK_NAMES = {
+    MaskState.Missing: "missing",
+    MaskState.MedicalMask: "medical_mask",
+    MaskState.Occluded: "occluded",
+}
 
 
 class Mask(BaseEstimation):
@@ -176,6 +193,8 @@ class Mask(BaseEstimation):
         - mask
     """
 
+    __slots__ = ("faceOcclusion",)
+
     #  pylint: disable=W0235
     def __init__(self, mask: MedicalMaskEstimation):
         """
@@ -241,22 +260,24 @@ class Mask(BaseEstimation):
         }
 
         """
-        predominant = self.predominateMask
-        if predominant == MaskState.Occluded:
-            predominantName = "occluded"
-        elif predominant == MaskState.MedicalMask:
-            predominantName = "medical_mask"
-        else:
-            predominantName = "missing"
+        coreEstimation = self._coreEstimation
         return {
-            "predominant_mask": predominantName,
-            "estimations": {"medical_mask": self.medicalMask, "missing": self.missing, "occluded": self.occluded},
+            "predominant_mask": _PREDOMINANT_MASK_NAMES[MaskState.fromCoreEmotion(coreEstimation.result)],
+            "estimations": {
+                "medical_mask": coreEstimation.maskScore,
+                "missing": coreEstimation.noMaskScore,
+                "occluded": coreEstimation.occludedFaceScore,
+            },
             "face_occlusion": self.faceOcclusion.asDict(),
         }
 
 
 POST_PROCESSING = DefaultPostprocessingFactory(Mask)
 
+#: warp input types of `MaskEstimator.estimate`; a tuple for a single isinstance call which also covers subclasses
+#: such as `VLWarpedImage`
+_WARP_TYPES = (FaceWarp, FaceWarpedImage)
+
 
 class MaskEstimator(BaseEstimator):
     """
@@ -292,7 +313,7 @@ class MaskEstimator(BaseEstimator):
         Raises:
             LunaSDKException: if estimation failed
         """
-        if isinstance(faceObject, (FaceWarpedImage, FaceWarp)):
+        if isinstance(faceObject, _WARP_TYPES):
             if asyncEstimate:
                 task = self._coreEstimator.asyncEstimate(faceObject.warpedImage.coreImage)
                 return AsyncTask(task, POST_PROCESSING.postProcessing)
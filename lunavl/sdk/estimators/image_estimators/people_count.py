@@ -39,7 +39,7 @@ def getEstimatorArgsFromImages(
     for image in images:
         if isinstance(image, VLImage):
             img = image
-            detectAreas.append(image.coreImage.getRect())
+            detectAreas.append(image.coreRect)
         else:
             img = image[0]
             detectAreas.append(image[1].coreRectI)
@@ -101,7 +101,7 @@ class PeopleCountEstimator(BaseEstimator):
             detectArea = image.detectArea.coreRectI
             image = image.image
         else:
-            detectArea = image.coreImage.getRect()
+            detectArea = image.coreRect
         validateInputByBatchEstimator(self._coreEstimator, [image.coreImage], [detectArea])
         if asyncEstimate:
             task = self._coreEstimator.asyncEstimate([image.coreImage], [detectArea])
@@ -167,13 +167,13 @@ class DetectorType(BiDirectionEnum):
         Returns:
             ObjectDetectorClassType
         """
-        mapEnumToCoreEnum = {
-            "Default": "FACE_DET_DEFAULT",
-            "FaceDetV1": "FACE_DET_V1",
-            "FaceDetV2": "FACE_DET_V2",
-            "FaceDetV3": "FACE_DET_V3",
-        }
-        return getattr(ObjectDetectorClassType, mapEnumToCoreEnum[self.value])
+        return _CORE_DETECTOR_TYPES[self]
+
+
+#: detector type to core detector type map, built once instead of a getattr per `coreDetectorType` access
+_CORE_DETECTOR_TYPES = {
+    detectorType: getattr(ObjectDetectorClassType, detectorType.name) for detectorType in DetectorType
+}
 
 
 class PeopleCountEstimatorType(Enum):
@@ -8,7 +8,7 @@ from typing import Optional, Union
 
 import numpy as np
 import requests
-from FaceEngine import FormatType, Image as CoreImage  # pylint: disable=E0611,E0401
+from FaceEngine import FormatType, Image as CoreImage, Rect as CoreRect  # pylint: disable=E0611,E0401
 from PIL import Image as pilImage
 from PIL.Image import Image as PilImage
 
@@ -149,7 +149,7 @@ class VLImage:
         filename (str): filename of the file which is source of image
     """
 
-    __slots__ = ("coreImage", "source", "filename")
+    __slots__ = ("coreImage", "source", "filename", "_coreRect")
 
     def __init__(
         self,
@@ -344,6 +344,22 @@ class VLImage:
         """
         return ColorFormat.convertCoreFormat(self.coreImage.getFormat())
 
+    @property
+    def coreRect(self) -> CoreRect:
+        """
+        Get core rect of image.
+
+        The image size is immutable, so the rect is requested from the core once and cached.
+
+        Returns:
+            core rect of the image
+        """
+        coreRect = getattr(self, "_coreRect", None)
+        if coreRect is None:
+            coreRect = self.coreImage.getRect()
+            self._coreRect = coreRect
+        return coreRect
+
     @property
     def rect(self) -> Rect:
         """
@@ -352,7 +368,7 @@ class VLImage:
         Returns:
             rect of the image
         """
-        return Rect.fromCoreRect(self.coreImage.getRect())
+        return Rect.fromCoreRect(self.coreRect)
 
     def computePitch(self, rowWidth) -> int:
         """
@@ -0,0 +1,45 @@
+"""
+Module realize vectorized non-maximum suppression over detection arrays.
+"""
+import numpy as np
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iouThreshold: float = 0.5) -> np.ndarray:
+    """
+    Greedy non-maximum suppression over detection boxes.
+
+    Intended for post processing of `FaceDetector.detectArrays` results: candidates are visited in
+    descending score order and a box is suppressed when its IoU with an already kept box exceeds
+    `iouThreshold`. The IoU of the current box against all remaining candidates is computed in one
+    vectorized numpy pass.
+
+    Args:
+        boxes: (N, 4) array of boxes in (x, y, width, height) format
+        scores: (N,) array of detection scores
+        iouThreshold: intersection over union threshold for suppression
+
+    Returns:
+        array of indices of kept boxes, sorted by descending score (ties keep the input order); degenerate
+        zero-area boxes have zero IoU with everything and are never suppressed
+    """
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.int64)
+    x1 = boxes[:, 0]
+    y1 = boxes[:, 1]
+    x2 = x1 + boxes[:, 2]
+    y2 = y1 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+    order = np.argsort(-scores, kind="stable")
+    keep = []
+    while order.size:
+        best = order[0]
+        keep.append(best)
+        rest = order[1:]
+        interWidth = np.clip(np.minimum(x2[best], x2[rest]) - np.maximum(x1[best], x1[rest]), 0, None)
+        interHeight = np.clip(np.minimum(y2[best], y2[rest]) - np.maximum(y1[best], y1[rest]), 0, None)
+        intersection = interWidth * interHeight
+        union = areas[best] + areas[rest] - intersection
+        # a zero-area box has an empty union; treat it as non overlapping instead of dividing by zero
+        iou = np.divide(intersection, union, out=np.zeros_like(union), where=union > 0)
+        order = rest[iou <= iouThreshold]
+    return np.array(keep, dtype=np.int64)
@@ -0,0 +1,70 @@
+"""
+Module realize a staged async pipeline over sdk detectors and estimators.
+"""
+import asyncio
+from typing import Any, List, Optional, Tuple, Union
+
+from .detectors.base import ImageForDetection
+from .detectors.facedetector import FaceDetection, FaceDetector
+from .estimators.base import BaseEstimator
+from .image_utils.image import VLImage
+
+
+async def detectAndEstimate(
+    images: List[Union[VLImage, ImageForDetection]],
+    detector: FaceDetector,
+    estimator: BaseEstimator,
+    queueDepth: int = 3,
+) -> List[List[Any]]:
+    """
+    Run detection and estimation on images as a two stage pipeline.
+
+    A producer detects faces on each image through the async detector api and puts results to a bounded queue,
+    a consumer estimates attributes for every found detection. The queue keeps at most `queueDepth` detect
+    results in flight, so both stages stay busy without unbounded buffering.
+
+    Args:
+        images: input images
+        detector: face detector
+        estimator: estimator which supports estimation from a face detection (for example a mask estimator)
+        queueDepth: max count of detect results waiting for estimation
+
+    Returns:
+        list of estimation lists, one list per input image in the input order
+    Raises:
+        LunaSDKException: if detection or estimation failed
+    """
+    queue: "asyncio.Queue[Optional[Tuple[int, List[FaceDetection]]]]" = asyncio.Queue(maxsize=queueDepth)
+    results: List[List[Any]] = [[] for _ in images]
+
+    async def produce():
+        """Detect faces image by image and push results to the queue."""
+        for index, image in enumerate(images):
+            detections = await detector.detect([image], asyncEstimate=True)
+            await queue.put((index, detections[0]))
+        await queue.put(None)
+
+    async def consume():
+        """Estimate attributes for each pushed detect result."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, detections = item
+            if detections:
+                estimations = await asyncio.gather(
+                    *(estimator.estimate(detection, asyncEstimate=True) for detection in detections)
+                )
+                results[index] = list(estimations)
+
+    producer = asyncio.ensure_future(produce())
+    consumer = asyncio.ensure_future(consume())
+    try:
+        await asyncio.gather(producer, consumer)
+    finally:
+        # if one stage failed, cancel the other instead of leaving it blocked on the queue forever
+        for stage in (producer, consumer):
+            if not stage.done():
+                stage.cancel()
+        await asyncio.gather(producer, consumer, return_exceptions=True)
+    return results
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from lunavl.sdk.detectors.base import ImageForDetection
@@ -483,3 +484,56 @@ class TestFaceDetector(FaceDetectTestClass):
         self.assertAsyncEstimation(task, FaceDetection)
         task = self.defaultDetector.detect([VLIMAGE_ONE_FACE] * 2, asyncEstimate=True)
         self.assertAsyncBatchEstimation(task, FaceDetection)
+
+    def test_detect_arrays(self):
+        """
+        Test detection as arrays with image of one face
+        """
+        for detector in self.detectors:
+            with self.subTest(detectorType=detector.detectorType):
+                boxes, scores = detector.detectArrays(images=[VLIMAGE_ONE_FACE])[0]
+                assert (1, 4) == boxes.shape
+                assert (1,) == scores.shape
+                assert np.float32 == boxes.dtype
+                assert np.float32 == scores.dtype
+                assert 0 < scores[0] <= 1
+
+    def test_detect_arrays_of_multiple_images(self):
+        """
+        Test batch detection as arrays of multiple images keeps the input order
+        """
+        res = TestFaceDetector.defaultDetector.detectArrays(images=[VLIMAGE_SEVERAL_FACE, VLIMAGE_ONE_FACE])
+        assert 2 == len(res)
+        assert 5 == res[0][0].shape[0]
+        assert 1 == res[1][0].shape[0]
+        for boxes, scores in res:
+            assert boxes.shape[0] == scores.shape[0]
+
+    def test_detect_arrays_matches_detect(self):
+        """
+        Test that detection as arrays returns the same boxes and scores as detect
+        """
+        detection = TestFaceDetector.defaultDetector.detect(images=[VLIMAGE_ONE_FACE])[0][0]
+        boxes, scores = TestFaceDetector.defaultDetector.detectArrays(images=[VLIMAGE_ONE_FACE])[0]
+        rect = detection.boundingBox.rect
+        assert np.allclose(boxes[0], (rect.x, rect.y, rect.width, rect.height), atol=1)
+        assert abs(float(scores[0]) - detection.boundingBox.score) < 0.01
+
+    def test_detect_arrays_with_image_for_detection(self):
+        """
+        Test detection as arrays with transfer structure image for detection
+        """
+        boxes, scores = TestFaceDetector.defaultDetector.detectArrays(
+            images=[ImageForDetection(image=VLIMAGE_ONE_FACE, detectArea=GOOD_AREA)]
+        )[0]
+        assert 1 == boxes.shape[0]
+        assert 1 == scores.shape[0]
+
+    def test_detect_arrays_invalid_image_format(self):
+        """
+        Test detection as arrays with invalid image format
+        """
+        imageWithOneFace = VLImage.load(filename=ONE_FACE, colorFormat=ColorFormat.B8G8R8)
+        with pytest.raises(LunaSDKException) as exceptionInfo:
+            TestFaceDetector.defaultDetector.detectArrays(images=[imageWithOneFace])
+        self.assertLunaVlError(exceptionInfo, LunaVLError.BatchedInternalError.format("Failed validation."))
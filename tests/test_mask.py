@@ -16,6 +16,7 @@ from lunavl.sdk.estimators.face_estimators.mask import (
 )
 from lunavl.sdk.faceengine.setting_provider import DetectorType
 from lunavl.sdk.image_utils.image import VLImage
+from lunavl.sdk.luna_faces import VLWarpedImage
 from tests.base import BaseTestClass
 from tests.resources import (
     FACE_WITH_MASK,
@@ -120,6 +121,14 @@ class TestMask(BaseTestClass):
                     mask = TestMask.maskEstimator.estimate(faceDetection)
                 assert case.expectedResult == mask.predominateMask
 
+    def test_estimate_mask_with_warp_subclass(self):
+        """
+        Test mask estimation with a FaceWarpedImage subclass takes the warp branch
+        """
+        warp = VLWarpedImage(VLImage.load(filename=FACE_WITH_MASK))
+        mask = TestMask.maskEstimator.estimate(warp)
+        self.assertMaskEstimation(mask, self.medicalMaskWarpNProperties.expectedProperties._asdict())
+
     def test_estimate_mask_batch(self):
         """
         Test batch mask estimation
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from lunavl.sdk.nms import nms
+
+
+class TestNms(unittest.TestCase):
+    """
+    Test vectorized non-maximum suppression helper.
+    """
+
+    def test_nms_suppression_above_threshold(self):
+        """
+        Test that a box overlapping the best box above the threshold is suppressed
+        """
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [20, 20, 5, 5]], dtype=np.float32)
+        scores = np.array([0.9, 0.8, 0.7], dtype=np.float32)
+        keep = nms(boxes, scores, iouThreshold=0.5)
+        assert [0, 2] == keep.tolist()
+
+    def test_nms_below_threshold_kept(self):
+        """
+        Test that overlapping boxes below the threshold are all kept
+        """
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10]], dtype=np.float32)
+        scores = np.array([0.9, 0.8], dtype=np.float32)
+        keep = nms(boxes, scores, iouThreshold=0.9)
+        assert [0, 1] == keep.tolist()
+
+    def test_nms_score_ordering(self):
+        """
+        Test that kept indices are returned in descending score order
+        """
+        boxes = np.array([[0, 0, 5, 5], [100, 100, 5, 5], [200, 200, 5, 5]], dtype=np.float32)
+        scores = np.array([0.1, 0.9, 0.5], dtype=np.float32)
+        keep = nms(boxes, scores, iouThreshold=0.5)
+        assert [1, 2, 0] == keep.tolist()
+
+    def test_nms_tie_ordering(self):
+        """
+        Test that equal scores keep the input box order
+        """
+        boxes = np.array([[0, 0, 5, 5], [100, 100, 5, 5], [200, 200, 5, 5]], dtype=np.float32)
+        scores = np.array([0.5, 0.5, 0.5], dtype=np.float32)
+        keep = nms(boxes, scores, iouThreshold=0.5)
+        assert [0, 1, 2] == keep.tolist()
+
+    def test_nms_empty_input(self):
+        """
+        Test nms with empty input
+        """
+        keep = nms(np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.float32))
+        assert [] == keep.tolist()
+
+    def test_nms_zero_area_boxes(self):
+        """
+        Test that zero-area boxes produce no invalid division and are never suppressed by overlap
+        """
+        boxes = np.array([[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 10, 10]], dtype=np.float32)
+        scores = np.array([0.9, 0.8, 0.7], dtype=np.float32)
+        with np.errstate(invalid="raise", divide="raise"):
+            keep = nms(boxes, scores, iouThreshold=0.5)
+        assert [0, 1, 2] == keep.tolist()